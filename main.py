@@ -12,15 +12,16 @@ Usage:
     python main.py --list                       # List sample files
 """
 import argparse
+import asyncio
 import os
 import sys
 from datetime import datetime
 
-# Add src to path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-
-from src.crew import DataQualityCrew
-from src.config.settings import OUTPUT_DIR
+def _sample_files(sample_dir: str) -> list[tuple[str, int]]:
+    """Return (name, size) for each file in the sample directory, sorted by name."""
+    # DirEntry.stat() reuses the data from the directory scan where the OS provides it
+    with os.scandir(sample_dir) as entries:
+        return sorted((e.name, e.stat().st_size) for e in entries if e.is_file())
 
 
 def list_sample_files():
@@ -29,10 +30,8 @@ def list_sample_files():
     print("\n📁 Available Sample Files:")
     print("-" * 40)
     
-    for f in os.listdir(sample_dir):
-        filepath = os.path.join(sample_dir, f)
-        size = os.path.getsize(filepath)
-        print(f"  • {f} ({size:,} bytes)")
+    for name, size in _sample_files(sample_dir):
+        print(f"  • {name} ({size:,} bytes)")
     
     print("\nUsage: python main.py --data sample_data/<filename>")
     print()
@@ -49,6 +48,10 @@ def run_assessment(data_file: str, cde_config: str = "", polish: bool = False) -
     Returns:
         Path to the generated report
     """
+    # Deferred so --help and --list don't pay for importing crewai/pandas
+    from src.crew import DataQualityCrew
+    from src.config.settings import OUTPUT_DIR
+    
     # Validate inputs
     if not os.path.exists(data_file):
         raise FileNotFoundError(f"Data file not found: {data_file}")
@@ -70,18 +73,14 @@ def run_assessment(data_file: str, cde_config: str = "", polish: bool = False) -
     print(f"🕐 Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print("=" * 60 + "\n")
     
-    # Create and run crew
-    crew = DataQualityCrew(data_file, cde_config, polish=polish)
-    result = crew.run()
-    
     # Generate report filename
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     data_name = os.path.splitext(os.path.basename(data_file))[0]
     report_path = os.path.join(OUTPUT_DIR, f"dq_assessment_{data_name}_{timestamp}.md")
     
-    # Save report
-    with open(report_path, 'w') as f:
-        f.write(str(result))
+    # Create and run crew - the final task writes the report to report_path
+    crew = DataQualityCrew(data_file, cde_config, polish=polish, report_path=report_path)
+    asyncio.run(crew.run())
     
     print("\n" + "=" * 60)
     print("✅ ASSESSMENT COMPLETE")
@@ -103,9 +102,10 @@ def interactive_mode():
     
     # List sample files
     sample_dir = os.path.join(os.path.dirname(__file__), "sample_data")
+    sample_names = [name for name, _ in _sample_files(sample_dir)]
     print("📁 Sample files available:")
-    for f in os.listdir(sample_dir):
-        print(f"   • sample_data/{f}")
+    for name in sample_names:
+        print(f"   • sample_data/{name}")
     print()
     
     # Get data file
@@ -118,7 +118,7 @@ def interactive_mode():
     cde_config = input("Enter CDE config path (or press Enter to skip): ").strip()
     if not cde_config:
         default_cde = os.path.join(sample_dir, "cde_config.json")
-        if os.path.exists(default_cde):
+        if "cde_config.json" in sample_names:
             use_default = input(f"Use default CDE config? (Y/n): ").strip().lower()
             if use_default != 'n':
                 cde_config = default_cde
@@ -188,7 +188,9 @@ Examples:
             print(f"\n❌ Error: {e}")
             sys.exit(1)
     else:
-        # Interactive mode
+        # Interactive mode - fail fast instead of blocking on input() in CI/pipes
+        if not sys.stdin.isatty():
+            parser.error("interactive mode requires a TTY; pass --data")
         interactive_mode()
 
 
@@ -1,4 +1,10 @@
-"""Data Quality Assessment Agents."""
+"""Data Quality Assessment Agents.
+
+Agent definitions don't depend on the dataset being assessed, so each factory
+builds its agent once per process and returns the cached instance afterwards.
+"""
+from functools import lru_cache
+
 from crewai import Agent
 
 from src.tools.data_tools import (
@@ -10,6 +16,7 @@ from src.tools.data_tools import (
 )
 
 
+@lru_cache(maxsize=1)
 def create_profiler_agent() -> Agent:
     """Create the Data Profiler Agent."""
     return Agent(
@@ -27,6 +34,7 @@ def create_profiler_agent() -> Agent:
     )
 
 
+@lru_cache(maxsize=1)
 def create_validator_agent() -> Agent:
     """Create the Data Validator Agent."""
     return Agent(
@@ -44,6 +52,7 @@ def create_validator_agent() -> Agent:
     )
 
 
+@lru_cache(maxsize=1)
 def create_anomaly_detector_agent() -> Agent:
     """Create the Anomaly Detector Agent."""
     return Agent(
@@ -61,6 +70,7 @@ def create_anomaly_detector_agent() -> Agent:
     )
 
 
+@lru_cache(maxsize=1)
 def create_report_writer_agent() -> Agent:
     """Create the Report Writer Agent."""
     return Agent(
@@ -78,6 +88,7 @@ def create_report_writer_agent() -> Agent:
     )
 
 
+@lru_cache(maxsize=1)
 def create_senior_editor_agent() -> Agent:
     """Create the Senior Editor Agent for executive-quality reports."""
     return Agent(
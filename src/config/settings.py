@@ -1,21 +1,30 @@
 """Configuration settings for Data Quality Assessment Tool."""
 import os
+import re
+from types import MappingProxyType
+
 from dotenv import load_dotenv
 
-load_dotenv()
+# Set DQ_SKIP_DOTENV=1 to skip the .env lookup (e.g. tests and benchmarks)
+if os.getenv("DQ_SKIP_DOTENV") != "1":
+    load_dotenv()
 
 # API Configuration
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
 
+# Orchestration
+# Column profiling, validation and anomaly detection are independent and run concurrently
+MAX_PARALLEL_AGENTS = int(os.getenv("MAX_PARALLEL_AGENTS", 8))
+
 # Data Quality Thresholds
-THRESHOLDS = {
+THRESHOLDS = MappingProxyType({
     "completeness": float(os.getenv("COMPLETENESS_THRESHOLD", 0.95)),
     "uniqueness": float(os.getenv("UNIQUENESS_THRESHOLD", 0.99)),
     "validity": float(os.getenv("VALIDITY_THRESHOLD", 0.98)),
     "consistency": 0.95,
     "timeliness": 0.90,
-}
+})
 
 # Severity Levels
 SEVERITY = {
@@ -35,6 +44,8 @@ CDE_PATTERNS = [
     "date_of_birth", "dob",
     "name", "first_name", "last_name",
 ]
+# Single alternation so a column name is classified in one scan
+CDE_PATTERN_RE = re.compile("|".join(re.escape(p) for p in CDE_PATTERNS))
 
 # Validation Rules by Data Type
 VALIDATION_RULES = {
@@ -46,4 +57,10 @@ VALIDATION_RULES = {
 }
 
 # Output Configuration
-OUTPUT_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "output")
+OUTPUT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "output"))
+# CSVs larger than this are profiled and scanned for anomalies in streamed chunks
+STREAMING_THRESHOLD_MB = float(os.getenv("STREAMING_THRESHOLD_MB", 512))
+# Parquet cache of loaded datasets, reused across runs. Off unless DQ_CACHE_DIR is
+# set: each entry is a full copy of an assessed dataset, including any PII in it
+CACHE_DIR = os.getenv("DQ_CACHE_DIR", "")
+CACHE_MAX_MB = float(os.getenv("DQ_CACHE_MAX_MB", 2048))
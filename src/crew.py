@@ -1,6 +1,14 @@
 """Data Quality Assessment Crew Orchestration."""
+import asyncio
+import json
+import os
+
 from crewai import Crew, Process
 
+from src.config.settings import (
+    CDE_PATTERN_RE,
+    MAX_PARALLEL_AGENTS,
+)
 from src.agents.dq_agents import (
     create_profiler_agent,
     create_validator_agent,
@@ -8,7 +16,12 @@ from src.agents.dq_agents import (
     create_report_writer_agent,
     create_senior_editor_agent,
 )
+from src.tools.data_tools import (
+    DataLoaderTool,
+    CDELoaderTool,
+)
 from src.tasks.dq_tasks import (
+    create_column_profile_task,
     create_profiling_task,
     create_validation_task,
     create_anomaly_task,
@@ -20,13 +33,21 @@ from src.tasks.dq_tasks import (
 class DataQualityCrew:
     """Data Quality Assessment Crew."""
 
-    def __init__(self, data_file: str, cde_config: str = "", polish: bool = False):
+    def __init__(
+        self,
+        data_file: str,
+        cde_config: str = "",
+        polish: bool = False,
+        report_path: str = "",
+    ):
         """Initialize the Data Quality Crew.
         
         Args:
             data_file: Path to the data file to assess
             cde_config: Path to the CDE configuration file (optional)
             polish: Whether to include Senior Editor for executive polish
+            report_path: Where the final report is written (optional,
+                defaults to the report task's own output file)
         """
         self.data_file = data_file
         self.cde_config = cde_config
@@ -38,10 +59,23 @@ class DataQualityCrew:
         self.anomaly_detector = create_anomaly_detector_agent()
         self.report_writer = create_report_writer_agent()
         
+        # Plan column profiling subtasks - one copy of the profiler per column,
+        # since an agent instance cannot be shared by concurrently running crews
+        self.columns, self.cde_fields = self.plan_profiling()
+        self.column_profilers = [self.profiler.copy() for _ in self.columns]
+        self.column_profile_tasks = [
+            create_column_profile_task(
+                agent, data_file, column, column in self.cde_fields
+            )
+            for agent, column in zip(self.column_profilers, self.columns)
+        ]
+        
         # Create core tasks
         self.profiling_task = create_profiling_task(
             self.profiler, data_file, cde_config
         )
+        # Profiling task reduces the column profiles into a dataset profile
+        self.profiling_task.context = list(self.column_profile_tasks)
         self.validation_task = create_validation_task(
             self.validator, data_file, cde_config
         )
@@ -67,24 +101,83 @@ class DataQualityCrew:
             )
             # Polish task uses the draft report as context
             self.polish_task.context = [self.report_task]
+        
+        # CrewAI writes the final task's output straight to the report file.
+        # Assigned after construction on purpose: the output_file validator
+        # only runs in the constructor, where it would strip the leading slash
+        # and turn an absolute path into one relative to the working directory.
+        # The path is normalized here instead, since the validator would also
+        # have rejected any ".." in it.
+        if report_path:
+            final_task = self.polish_task if self.polish else self.report_task
+            final_task.output_file = os.path.abspath(report_path)
+
+    def plan_profiling(self) -> tuple[list[str], list[str]]:
+        """Plan the column profiling subtasks.
+        
+        CDE fields come from the CDE config, or from CDE_PATTERNS matched
+        against the column names when no config is given.
+        
+        Returns:
+            The columns to profile, CDE columns first so they are scheduled
+            ahead of the rest, and the CDE field names
+        """
+        dataset = DataLoaderTool()._run(self.data_file)
+        try:
+            # Column labels can be integers, e.g. for a JSON array of arrays
+            columns = [str(c) for c in json.loads(dataset)["column_names"]]
+        except ValueError:
+            raise ValueError(dataset) from None
+        
+        if self.cde_config:
+            config = CDELoaderTool()._run(self.cde_config)
+            try:
+                cde_fields = json.loads(config)["cde_fields"]
+            except ValueError:
+                raise ValueError(config) from None
+        else:
+            # No CDE config - auto-flag columns whose names match CDE patterns
+            cde_fields = [c for c in columns if CDE_PATTERN_RE.search(c.lower())]
+        
+        columns.sort(key=lambda column: column not in cde_fields)
+        return columns, cde_fields
 
-    def create_crew(self) -> Crew:
-        """Create and return the Data Quality Crew."""
-        # Build agent list
-        agents = [
-            self.profiler,
-            self.validator,
-            self.anomaly_detector,
-            self.report_writer,
+    @staticmethod
+    def _single_task_crew(agent, task) -> Crew:
+        """Create a crew that runs one task with one agent."""
+        return Crew(
+            agents=[agent],
+            tasks=[task],
+            process=Process.sequential,
+            verbose=True,
+        )
+
+    def create_column_profile_crews(self) -> list[Crew]:
+        """Create one crew per column profiling subtask."""
+        return [
+            self._single_task_crew(agent, task)
+            for agent, task in zip(self.column_profilers, self.column_profile_tasks)
         ]
+
+    def create_analysis_crews(self) -> list[Crew]:
+        """Create the validation and anomaly detection crews.
         
-        # Build task list
-        tasks = [
-            self.profiling_task,
-            self.validation_task,
-            self.anomaly_task,
-            self.report_task,
+        Neither depends on profiling or on each other, so both run
+        concurrently with the column profiling subtasks.
+        """
+        return [
+            self._single_task_crew(self.validator, self.validation_task),
+            self._single_task_crew(self.anomaly_detector, self.anomaly_task),
         ]
+
+    def create_report_crew(self) -> Crew:
+        """Create the crew that writes (and optionally polishes) the report.
+        
+        The report task reads the analysis outputs through its context, so this
+        crew must be kicked off after all analysis crews have finished.
+        """
+        agents = [self.report_writer]
+        tasks = [self.report_task]
         
         # Add editor if polish is enabled
         if self.polish:
@@ -98,12 +191,45 @@ class DataQualityCrew:
             verbose=True,
         )
 
-    def run(self) -> str:
+    async def _kickoff_analysis(self, crew: Crew, semaphore: asyncio.Semaphore):
+        """Kick off one analysis crew, bounded by the shared semaphore.
+        
+        There is no timeout: kickoff_async runs the crew in a worker thread,
+        which cannot be cancelled, so abandoning it on a timeout would only
+        free its semaphore slot while it kept running.
+        """
+        async with semaphore:
+            return await crew.kickoff_async()
+
+    async def _run_profiling(self, semaphore: asyncio.Semaphore):
+        """Profile all columns concurrently, then aggregate the column profiles."""
+        await asyncio.gather(*(
+            self._kickoff_analysis(crew, semaphore)
+            for crew in self.create_column_profile_crews()
+        ))
+        return await self._kickoff_analysis(
+            self._single_task_crew(self.profiler, self.profiling_task), semaphore
+        )
+
+    async def run(self) -> str:
         """Run the Data Quality Assessment.
         
+        Column profiling, validation and anomaly detection fan out
+        concurrently so their LLM calls overlap; the report crew fans in once
+        all of them have completed.
+        
         Returns:
             The final assessment report as a string
         """
-        crew = self.create_crew()
-        result = crew.kickoff()
-        return result
+        semaphore = asyncio.Semaphore(MAX_PARALLEL_AGENTS)
+        await asyncio.gather(
+            self._run_profiling(semaphore),
+            *(
+                self._kickoff_analysis(crew, semaphore)
+                for crew in self.create_analysis_crews()
+            ),
+        )
+        
+        crew = self.create_report_crew()
+        result = await crew.kickoff_async()
+        return result.raw
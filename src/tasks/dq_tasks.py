@@ -1,19 +1,36 @@
-"""Data Quality Assessment Tasks."""
+"""Data Quality Assessment Tasks.
+
+Task descriptions are module-level templates: the invariant instructions come
+first and the dataset-specific values last, so every run sends the LLM the
+same prompt prefix (which providers can serve from their prompt cache).
+"""
+from string import Template
+
 from crewai import Task, Agent
 
 
-def create_profiling_task(agent: Agent, data_file: str, cde_config: str) -> Task:
-    """Create the data profiling task."""
-    return Task(
-        description=f"""Profile the dataset to understand its structure and quality characteristics.
+_COLUMN_PROFILE_DESCRIPTION = Template("""Profile a single column of the dataset.
 
-        DATA FILE: {data_file}
-        CDE CONFIG: {cde_config}
+        Run the data profiler on this column only: pass the COLUMN below as `columns`,
+        and also as `cde_fields` if it is a critical data element. Then report:
+        1. Data type and type consistency
+        2. Completeness (% non-null values) and null count
+        3. Uniqueness (% unique values) and duplicate count
+        4. Value distribution and statistics (numeric range, string lengths, sample values)
+        5. Any quality concern for this column (high nulls, low uniqueness, type issues)
 
-        Your profiling must include:
-        1. Load and examine the dataset structure (columns, rows, data types)
+        DATA FILE: $data_file
+        COLUMN: $column
+        CRITICAL DATA ELEMENT: $cde_flag""")
+
+
+_PROFILING_DESCRIPTION = Template("""Combine the column profiles into a profile of the whole dataset.
+
+        Each column has already been profiled; the column profiles are provided as context.
+        Your profile must include:
+        1. Load and examine the dataset structure (columns, rows, memory)
         2. Load the CDE (Critical Data Element) configuration to identify which fields are CDEs
-        3. Profile ALL columns with special emphasis on CDE fields:
+        3. Consolidate the column profiles with special emphasis on CDE fields:
            - Completeness (% non-null values)
            - Uniqueness (% unique values)
            - Data type consistency
@@ -24,24 +41,13 @@ def create_profiling_task(agent: Agent, data_file: str, cde_config: str) -> Task
            - Whether they meet stricter CDE thresholds
         5. Identify columns with quality concerns (high nulls, low uniqueness, type issues)
         
-        Provide a comprehensive profile with CDE analysis highlighted separately.""",
-        expected_output="""A detailed data profile including:
-        - Dataset overview (rows, columns, memory)
-        - CDE field identification and their quality metrics
-        - Column-by-column profile with completeness, uniqueness, statistics
-        - Summary of quality concerns
-        - CDE compliance status against defined thresholds""",
-        agent=agent,
-    )
+        Provide a comprehensive profile with CDE analysis highlighted separately.
 
+        DATA FILE: $data_file
+        CDE CONFIG: $cde_config""")
 
-def create_validation_task(agent: Agent, data_file: str, cde_config: str) -> Task:
-    """Create the data validation task."""
-    return Task(
-        description=f"""Validate the dataset against business rules and CDE requirements.
 
-        DATA FILE: {data_file}
-        CDE CONFIG: {cde_config}
+_VALIDATION_DESCRIPTION = Template("""Validate the dataset against business rules and CDE requirements.
 
         Validation checks must include:
         1. Format validation (emails, phones, dates, IDs)
@@ -55,23 +61,13 @@ def create_validation_task(agent: Agent, data_file: str, cde_config: str) -> Tas
         6. Business rule compliance
         
         Categorize all issues by severity: CRITICAL, HIGH, MEDIUM, LOW
-        CDE violations should generally be CRITICAL or HIGH.""",
-        expected_output="""A validation report including:
-        - Total records validated
-        - Issue counts by severity (Critical/High/Medium/Low)
-        - Detailed issue list with field, rule violated, count, and sample values
-        - CDE violations highlighted separately
-        - Overall validity score""",
-        agent=agent,
-    )
+        CDE violations should generally be CRITICAL or HIGH.
 
+        DATA FILE: $data_file
+        CDE CONFIG: $cde_config""")
 
-def create_anomaly_task(agent: Agent, data_file: str) -> Task:
-    """Create the anomaly detection task."""
-    return Task(
-        description=f"""Detect statistical anomalies and outliers in the dataset.
 
-        DATA FILE: {data_file}
+_ANOMALY_DESCRIPTION = Template("""Detect statistical anomalies and outliers in the dataset.
 
         Analyze all numeric columns for:
         1. Statistical outliers using Z-score method (values > 3 standard deviations)
@@ -81,21 +77,12 @@ def create_anomaly_task(agent: Agent, data_file: str) -> Task:
         5. Values that are technically valid but statistically unusual
         
         Consider business context when flagging anomalies - some outliers may be 
-        legitimate (e.g., high-net-worth customers with large balances).""",
-        expected_output="""An anomaly report including:
-        - Number of numeric columns analyzed
-        - Columns with detected anomalies
-        - For each anomalous column: outlier counts, statistical context
-        - Assessment of whether anomalies likely indicate quality issues
-        - Recommendations for investigation""",
-        agent=agent,
-    )
+        legitimate (e.g., high-net-worth customers with large balances).
 
+        DATA FILE: $data_file""")
 
-def create_report_task(agent: Agent, data_file: str) -> Task:
-    """Create the final report writing task."""
-    return Task(
-        description=f"""Synthesize all findings into a comprehensive Data Quality Assessment Report.
+
+_REPORT_DESCRIPTION = """Synthesize all findings into a comprehensive Data Quality Assessment Report.
 
         Create a professional report that includes:
 
@@ -133,23 +120,10 @@ def create_report_task(agent: Agent, data_file: str) -> Task:
            - Statistical details
 
         The report should be suitable for presentation to both technical teams 
-        and business stakeholders.""",
-        expected_output="""A complete Data Quality Assessment Report in markdown format with:
-        - Executive summary with scores and key findings
-        - Visual scorecard (using markdown tables)
-        - CDE-focused analysis section
-        - Prioritized issue list
-        - Actionable recommendations
-        - Technical appendix""",
-        agent=agent,
-        output_file="output/dq_assessment_report.md",
-    )
+        and business stakeholders."""
 
 
-def create_polish_task(agent: Agent, data_file: str) -> Task:
-    """Create the senior editor polish task for executive-quality reports."""
-    return Task(
-        description=f"""Review and polish the Data Quality Assessment Report for executive presentation.
+_POLISH_DESCRIPTION = """Review and polish the Data Quality Assessment Report for executive presentation.
 
         You are editing a report that will be shared with Data Owners and senior leadership.
         Your task is to transform a good technical report into an exceptional executive document.
@@ -193,7 +167,87 @@ def create_polish_task(agent: Agent, data_file: str) -> Task:
            - Include clear contact/ownership information
 
         The final report should be something a Chief Data Officer would be proud to present 
-        to the board of directors.""",
+        to the board of directors."""
+
+
+def create_column_profile_task(agent: Agent, data_file: str, column: str, is_cde: bool) -> Task:
+    """Create the profiling subtask for a single column."""
+    return Task(
+        description=_COLUMN_PROFILE_DESCRIPTION.substitute(
+            data_file=data_file, column=column, cde_flag="yes" if is_cde else "no"
+        ),
+        expected_output=f"""A concise profile of column '{column}' with its completeness,
+        uniqueness, data type, statistics and any quality concerns.""",
+        agent=agent,
+    )
+
+
+def create_profiling_task(agent: Agent, data_file: str, cde_config: str) -> Task:
+    """Create the task that aggregates the column profiles into a dataset profile."""
+    return Task(
+        description=_PROFILING_DESCRIPTION.substitute(
+            data_file=data_file, cde_config=cde_config
+        ),
+        expected_output="""A detailed data profile including:
+        - Dataset overview (rows, columns, memory)
+        - CDE field identification and their quality metrics
+        - Column-by-column profile with completeness, uniqueness, statistics
+        - Summary of quality concerns
+        - CDE compliance status against defined thresholds""",
+        agent=agent,
+    )
+
+
+def create_validation_task(agent: Agent, data_file: str, cde_config: str) -> Task:
+    """Create the data validation task."""
+    return Task(
+        description=_VALIDATION_DESCRIPTION.substitute(
+            data_file=data_file, cde_config=cde_config
+        ),
+        expected_output="""A validation report including:
+        - Total records validated
+        - Issue counts by severity (Critical/High/Medium/Low)
+        - Detailed issue list with field, rule violated, count, and sample values
+        - CDE violations highlighted separately
+        - Overall validity score""",
+        agent=agent,
+    )
+
+
+def create_anomaly_task(agent: Agent, data_file: str) -> Task:
+    """Create the anomaly detection task."""
+    return Task(
+        description=_ANOMALY_DESCRIPTION.substitute(data_file=data_file),
+        expected_output="""An anomaly report including:
+        - Number of numeric columns analyzed
+        - Columns with detected anomalies
+        - For each anomalous column: outlier counts, statistical context
+        - Assessment of whether anomalies likely indicate quality issues
+        - Recommendations for investigation""",
+        agent=agent,
+    )
+
+
+def create_report_task(agent: Agent, data_file: str) -> Task:
+    """Create the final report writing task."""
+    return Task(
+        description=_REPORT_DESCRIPTION,
+        expected_output="""A complete Data Quality Assessment Report in markdown format with:
+        - Executive summary with scores and key findings
+        - Visual scorecard (using markdown tables)
+        - CDE-focused analysis section
+        - Prioritized issue list
+        - Actionable recommendations
+        - Technical appendix""",
+        agent=agent,
+        output_file="output/dq_assessment_report.md",
+    )
+
+
+def create_polish_task(agent: Agent, data_file: str) -> Task:
+    """Create the senior editor polish task for executive-quality reports."""
+    return Task(
+        description=_POLISH_DESCRIPTION,
         expected_output="""A polished, executive-ready Data Quality Assessment Report with:
         - Clean, scannable executive summary
         - Properly formatted markdown tables
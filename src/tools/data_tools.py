@@ -1,13 +1,771 @@
 """Data Quality Assessment Tools."""
-import json
+import functools
+import hashlib
 import os
-import re
+import tempfile
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Any
 
+import numpy as np
+import orjson
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
 from crewai.tools import BaseTool
-from scipy import stats
+from numba import config as numba_config, njit, prange
+
+from src.config.settings import CACHE_DIR, CACHE_MAX_MB, STREAMING_THRESHOLD_MB
+
+
+# The tools run off the main thread (CrewAI, run_quality_suite), after which
+# the TBB layer can hang at interpreter exit; prefer OpenMP unless overridden
+if "NUMBA_THREADING_LAYER_PRIORITY" not in os.environ:
+    numba_config.THREADING_LAYER_PRIORITY = ["omp", "tbb", "workqueue"]
+
+# fastmath without "nnan": the kernels rely on NaN checks to skip missing values
+_FASTMATH = {"reassoc", "contract", "arcp"}
+
+
+@njit(parallel=True, fastmath=_FASTMATH, cache=True)
+def zscore_outliers(arr, thresh):
+    """Count values with |z-score| > thresh in each column of a 2D array, ignoring NaNs."""
+    n_rows, n_cols = arr.shape
+    counts = np.zeros(n_cols, dtype=np.int64)
+    for j in prange(n_cols):
+        n = 0
+        total = 0.0
+        for i in range(n_rows):
+            v = arr[i, j]
+            if not np.isnan(v):
+                n += 1
+                total += v
+        if n == 0:
+            continue
+        mean = total / n
+        sq = 0.0
+        for i in range(n_rows):
+            v = arr[i, j]
+            if not np.isnan(v):
+                sq += (v - mean) * (v - mean)
+        std = np.sqrt(sq / n)
+        if std == 0.0:
+            continue
+        for i in range(n_rows):
+            v = arr[i, j]
+            if not np.isnan(v) and abs(v - mean) / std > thresh:
+                counts[j] += 1
+    return counts
+
+
+@njit(cache=True)
+def _quantile(values, q):
+    """Linearly interpolated quantile of a 1D array, using partial selection."""
+    pos = q * (len(values) - 1)
+    lo = int(np.floor(pos))
+    hi = min(lo + 1, len(values) - 1)
+    lo_val = np.partition(values, lo)[lo]
+    hi_val = np.partition(values, hi)[hi]
+    return lo_val + (hi_val - lo_val) * (pos - lo)
+
+
+@njit(parallel=True, cache=True)
+def iqr_outliers(arr, k):
+    """Count values outside [Q1 - k*IQR, Q3 + k*IQR] in each column of a 2D array, ignoring NaNs."""
+    n_cols = arr.shape[1]
+    counts = np.zeros(n_cols, dtype=np.int64)
+    for j in prange(n_cols):
+        col = arr[:, j]
+        values = col[~np.isnan(col)]
+        if len(values) == 0:
+            continue
+        q1 = _quantile(values, 0.25)
+        q3 = _quantile(values, 0.75)
+        iqr = q3 - q1
+        lower = q1 - k * iqr
+        upper = q3 + k * iqr
+        for v in values:
+            if v < lower or v > upper:
+                counts[j] += 1
+    return counts
+
+
+# Format rules applied by ValidatorTool: field -> (pattern, severity)
+FORMAT_RULES = {
+    "email": (r'^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$', "HIGH"),
+    "phone": (r'^\d{3}-\d{3}-\d{4}$', "MEDIUM"),
+}
+
+# Numeric rules applied by ValidatorTool: field -> (invalid-row expression, rule, severity, description)
+RANGE_RULES = {
+    "account_balance": ("account_balance < 0", "negative_value", "HIGH", "negative account balance"),
+    "credit_score": (
+        "(credit_score < 300) | (credit_score > 850)",
+        "range_validation",
+        "HIGH",
+        "credit score outside valid range (300-850)",
+    ),
+}
+
+
+def _format_match_mask(field: str, values: pd.Series) -> np.ndarray:
+    """Return a boolean mask of the string values that match the field's format rule.
+    
+    The whole column is scanned by Arrow's RE2 kernel; the rules are anchored,
+    so a substring match is a full match.
+    """
+    matches = pc.match_substring_regex(pa.array(values, type=pa.string()), FORMAT_RULES[field][0])
+    return matches.to_numpy(zero_copy_only=False)
+
+
+def optimize_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """Downcast numeric columns and categorize repetitive string columns.
+    
+    Integers are narrowed to the smallest type holding their range; floats
+    are narrowed to float32 only when no value changes; object/string
+    columns with fewer than half as many distinct values as rows become
+    categoricals. Columns of unhashable values are left as they are.
+    """
+    for col in df.columns:
+        col_data = df[col]
+        if pd.api.types.is_integer_dtype(col_data) and isinstance(col_data.dtype, np.dtype):
+            if len(col_data) == 0:
+                continue
+            col_min, col_max = col_data.min(), col_data.max()
+            for dtype in (np.int8, np.int16, np.int32):
+                if np.iinfo(dtype).min <= col_min and col_max <= np.iinfo(dtype).max:
+                    df[col] = col_data.astype(dtype)
+                    break
+        elif col_data.dtype == np.float64:
+            downcast = col_data.astype(np.float32)
+            if np.array_equal(downcast.to_numpy(dtype=np.float64), col_data.to_numpy(), equal_nan=True):
+                df[col] = downcast
+        elif pd.api.types.is_object_dtype(col_data) or pd.api.types.is_string_dtype(col_data):
+            # One unsorted hash pass gives the distinct count, and its codes are
+            # reused for the categorical when the column qualifies
+            try:
+                codes, uniques = pd.factorize(col_data, sort=False)
+            except TypeError:
+                # Unhashable values, e.g. nested lists or dicts from JSON, stay as objects
+                continue
+            if len(col_data) > 0 and len(uniques) / len(col_data) < 0.5:
+                df[col] = pd.Categorical.from_codes(codes, categories=uniques)
+    return df
+
+
+def _stat(file_path: str) -> tuple[int, int]:
+    """Version key of a file: its mtime (ns) and size.
+    
+    The size catches rewrites that land within the filesystem's mtime
+    resolution.
+    """
+    stat = os.stat(file_path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+# Bump when the loader's output changes, so entries written by an older loader are not served
+_CACHE_VERSION = 1
+
+
+def _parquet_cache_path(file_path: str) -> str:
+    """Cache file for a dataset.
+    
+    Keyed by the file's absolute path, size and mtime, and by the loader,
+    pandas and pyarrow versions that produced the frame.
+    """
+    mtime_ns, size = _stat(file_path)
+    key = f"{_CACHE_VERSION}:{pd.__version__}:{pa.__version__}:{os.path.abspath(file_path)}:{size}:{mtime_ns}"
+    digest = hashlib.sha1(key.encode()).hexdigest()[:16]
+    name = os.path.splitext(os.path.basename(file_path))[0]
+    return os.path.join(CACHE_DIR, f"{name}-{digest}.parquet")
+
+
+def _dedup_names(names: list) -> list:
+    """Rename blank and repeated CSV header names the way pd.read_csv does.
+    
+    Blank names become "Unnamed: <position>", and a repeated name takes the
+    first ".1", ".2", ... suffix not already in the header, so columns read
+    by Arrow have the same, unique, names as with the pandas parser.
+    """
+    header = [name or f"Unnamed: {i}" for i, name in enumerate(names)]
+    # Named columns claim their names before the unnamed ones, as in pandas
+    order = [i for i, name in enumerate(names) if name] + [i for i, name in enumerate(names) if not name]
+    counts = {}
+    for i in order:
+        col = base = header[i]
+        count = counts.get(col, 0)
+        while count > 0:
+            counts[base] = count + 1
+            col = f"{base}.{count}"
+            count = count + 1 if col in header else counts.get(col, 0)
+        header[i] = col
+        counts[col] = count + 1
+    return header
+
+
+def _read_csv(file_path: str) -> pd.DataFrame:
+    """Read a CSV file with Arrow's multithreaded parser.
+    
+    Strings stay in pandas' own string dtype (Arrow-backed on pandas 3) and
+    numbers in NumPy dtypes, which the numba kernels require. Header names
+    are deduplicated as pandas does. Files Arrow rejects, e.g. rows with a
+    varying number of fields, fall back to the pandas parser.
+    """
+    try:
+        table = pa_csv.read_csv(
+            file_path,
+            read_options=pa_csv.ReadOptions(use_threads=True),
+            convert_options=pa_csv.ConvertOptions(strings_can_be_null=True),
+        )
+    except pa.ArrowInvalid:
+        return pd.read_csv(file_path)
+    table = table.rename_columns(_dedup_names(table.column_names))
+    # The table is not used again, so let Arrow release it column by column
+    return table.to_pandas(split_blocks=True, self_destruct=True)
+
+
+def _prune_cache():
+    """Remove the least recently used cache files beyond CACHE_MAX_MB in total."""
+    entries = [e for e in os.scandir(CACHE_DIR) if e.name.endswith(".parquet")]
+    entries.sort(key=lambda e: e.stat().st_mtime, reverse=True)
+    total = 0
+    for entry in entries:
+        total += entry.stat().st_size
+        if total > CACHE_MAX_MB * 1024 * 1024:
+            try:
+                os.remove(entry.path)
+            except OSError:
+                pass
+
+
+def _parse_dataset(file_path: str) -> pd.DataFrame:
+    if file_path.endswith('.csv'):
+        df = _read_csv(file_path)
+    else:
+        df = pd.read_json(file_path)
+    return optimize_dtypes(df)
+
+
+def _read_dataset(file_path: str) -> pd.DataFrame:
+    """Read a CSV or JSON dataset with optimized dtypes.
+    
+    When DQ_CACHE_DIR is set, the optimized frame is also cached there as
+    Parquet, so later runs skip the parse until the file changes.
+    """
+    if not CACHE_DIR:
+        return _parse_dataset(file_path)
+    
+    cache_path = _parquet_cache_path(file_path)
+    if os.path.exists(cache_path):
+        try:
+            # Touch the entry so pruning evicts the least recently used files
+            os.utime(cache_path)
+        except OSError:
+            pass
+        return pd.read_parquet(cache_path)
+    
+    df = _parse_dataset(file_path)
+    
+    # Caching is best effort, e.g. mixed-type JSON columns cannot be written to Parquet
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+        os.close(fd)
+        try:
+            # Write then rename so concurrent tools never read a partial cache file
+            df.to_parquet(tmp_path)
+            os.replace(tmp_path, cache_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        # Parquet does not round-trip every dtype (e.g. a categorical of dates comes
+        # back as object), so serve the cached copy from the first run as well.
+        # Read before pruning, which can evict this entry if it alone exceeds the cap.
+        df = pd.read_parquet(cache_path)
+        _prune_cache()
+    except (OSError, ValueError, TypeError):
+        pass
+    return df
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_dataset(abs_path: str, mtime_ns: int, size: int) -> pd.DataFrame:
+    return _read_dataset(abs_path)
+
+
+def load_dataset(file_path: str) -> pd.DataFrame:
+    """Load a dataset, sharing one in-memory frame per version of the file.
+    
+    The returned frame is shared between tools and threads and must not be
+    modified in place.
+    """
+    abs_path = os.path.abspath(file_path)
+    return _cached_dataset(abs_path, *_stat(abs_path))
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_cde_config(abs_path: str, mtime_ns: int, size: int) -> dict:
+    with open(abs_path, 'rb') as f:
+        return orjson.loads(f.read())
+
+
+def load_cde_config(config_path: str) -> dict:
+    """Load a CDE configuration, sharing one parsed copy per version of the file.
+    
+    The returned dict is shared and must not be modified.
+    """
+    abs_path = os.path.abspath(config_path)
+    return _cached_cde_config(abs_path, *_stat(abs_path))
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_cde_rules(abs_path: str, mtime_ns: int, size: int) -> tuple[dict, tuple, tuple]:
+    config = _cached_cde_config(abs_path, mtime_ns, size)
+    rules = {cde["field"]: cde for cde in config.get("critical_data_elements", [])}
+    not_null_fields = tuple(f for f, r in rules.items() if r.get("nullable") == False)
+    unique_fields = tuple(f for f, r in rules.items() if r.get("unique") == True)
+    return rules, not_null_fields, unique_fields
+
+
+def load_cde_rules(config_path: str) -> tuple[dict, tuple, tuple]:
+    """Index a CDE configuration's rules, once per version of the file.
+    
+    Returns:
+        The rules keyed by field, the non-nullable fields and the unique
+        fields. The dict is shared and must not be modified.
+    """
+    abs_path = os.path.abspath(config_path)
+    return _cached_cde_rules(abs_path, *_stat(abs_path))
+
+
+_STREAM_BLOCK_SIZE = 16 << 20
+_ANOMALY_SAMPLE_SIZE = 100_000
+
+
+def should_stream(file_path: str) -> bool:
+    """Whether a dataset is too large to materialize and should be streamed."""
+    return (
+        file_path.endswith('.csv')
+        and os.path.getsize(file_path) > STREAMING_THRESHOLD_MB * 1024 * 1024
+    )
+
+
+def iter_chunks(file_path: str, columns: list | None = None, block_size: int | None = None):
+    """Yield the record batches of a CSV file, optionally limited to some columns.
+    
+    Columns are read with the names and widened types of _csv_schema, so a
+    value late in the file cannot fail the conversion of a type inferred from
+    the first block, and repeated header names select a single column.
+    """
+    schema = _csv_schema(file_path)
+    reader = pa_csv.open_csv(
+        file_path,
+        # The file's header row is replaced by the deduplicated names
+        read_options=pa_csv.ReadOptions(
+            block_size=block_size or _STREAM_BLOCK_SIZE,
+            column_names=schema.names,
+            skip_rows=1,
+        ),
+        convert_options=pa_csv.ConvertOptions(
+            column_types=schema,
+            include_columns=columns or [],
+            strings_can_be_null=True,
+        ),
+    )
+    for batch in reader:
+        yield batch
+
+
+def _csv_schema(file_path: str) -> pa.Schema:
+    """Schema for streaming a CSV file.
+    
+    Arrow infers types from the first block only, so they are widened to types
+    later blocks can still be converted to: integers become float64 (a later
+    1.5 is not an int) and every non-numeric column becomes string (a column
+    that is all null in the first block, or a later value that is not a
+    valid bool or date).
+    """
+    return pa.schema([
+        (field.name, pa.float64() if _is_numeric_type(field.type) else pa.string())
+        for field in _inferred_csv_schema(file_path)
+    ])
+
+
+def _inferred_csv_schema(file_path: str) -> pa.Schema:
+    """Types Arrow infers from the first block of a CSV file.
+    
+    Header names are deduplicated as in _read_csv.
+    """
+    inferred = pa_csv.open_csv(
+        file_path,
+        read_options=pa_csv.ReadOptions(block_size=_STREAM_BLOCK_SIZE),
+        convert_options=pa_csv.ConvertOptions(strings_can_be_null=True),
+    ).schema
+    return pa.schema([
+        (name, field.type) for name, field in zip(_dedup_names(inferred.names), inferred)
+    ])
+
+
+def _is_numeric_type(arrow_type: pa.DataType) -> bool:
+    return pa.types.is_integer(arrow_type) or pa.types.is_floating(arrow_type)
+
+
+def _is_string_type(arrow_type: pa.DataType) -> bool:
+    return pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type)
+
+
+def _is_integral(numbers: np.ndarray) -> bool:
+    """Whether a float array holds only whole numbers, ignoring NaNs."""
+    present = numbers[~np.isnan(numbers)]
+    return bool(np.all(present == np.trunc(present)))
+
+
+# pandas' infer_dtype kinds -> data_type names
+_INFERRED_TYPE_NAMES = {
+    "string": "string",
+    "boolean": "boolean",
+    "integer": "integer",
+    "floating": "float",
+    "date": "date",
+    "datetime": "datetime",
+    "datetime64": "datetime",
+    "empty": "null",
+}
+
+
+def _arrow_type_name(arrow_type: pa.DataType) -> str:
+    """data_type name of an Arrow type, in the vocabulary of _column_type_name."""
+    if pa.types.is_boolean(arrow_type):
+        return "boolean"
+    if pa.types.is_integer(arrow_type):
+        return "integer"
+    if pa.types.is_floating(arrow_type):
+        return "float"
+    if pa.types.is_date(arrow_type):
+        return "date"
+    if pa.types.is_timestamp(arrow_type):
+        return "datetime"
+    if pa.types.is_null(arrow_type):
+        return "null"
+    if _is_string_type(arrow_type):
+        return "string"
+    return "object"
+
+
+def _column_type_name(values: pd.Series) -> str:
+    """data_type reported for an in-memory column.
+    
+    Names the kind of values rather than the loader's storage dtype, so the
+    profile reads the same whether or not the file was streamed: floats
+    holding only whole numbers (integers with nulls) are "integer", and
+    categoricals are named by their categories.
+    """
+    dtype = values.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        return _column_type_name(pd.Series(dtype.categories))
+    if pd.api.types.is_bool_dtype(dtype):
+        return "boolean"
+    if pd.api.types.is_integer_dtype(dtype):
+        return "integer"
+    if pd.api.types.is_float_dtype(dtype):
+        numbers = values.to_numpy(dtype=np.float64, na_value=np.nan)
+        return "integer" if values.notna().any() and _is_integral(numbers) else "float"
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        return "datetime"
+    if pd.api.types.is_object_dtype(dtype):
+        return _INFERRED_TYPE_NAMES.get(pd.api.types.infer_dtype(values, skipna=True), "object")
+    if pd.api.types.is_string_dtype(dtype):
+        return "string"
+    return str(dtype)
+
+
+def _bit_length(values: np.ndarray) -> np.ndarray:
+    """Vectorized int.bit_length() for an array of uint64."""
+    length = np.zeros(values.shape, dtype=np.int64)
+    for shift in (32, 16, 8, 4, 2, 1):
+        wide = values >= (np.uint64(1) << np.uint64(shift))
+        length[wide] += shift
+        values = np.where(wide, values >> np.uint64(shift), values)
+    return length + (values > 0)
+
+
+class _HyperLogLog:
+    """HyperLogLog distinct-count sketch, updated a whole array at a time.
+    
+    Up to exact_limit distinct values are also counted exactly from their
+    64-bit hashes, so low-cardinality columns get exact counts.
+    """
+    
+    def __init__(self, precision: int = 14, exact_limit: int = 1 << 16):
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.int64)
+        self.exact_limit = exact_limit
+        self.exact_hashes = np.empty(0, dtype=np.uint64)
+    
+    def update(self, values: np.ndarray):
+        hashes = pd.util.hash_array(values)
+        if self.exact_hashes is not None:
+            self.exact_hashes = np.union1d(self.exact_hashes, hashes)
+            if len(self.exact_hashes) > self.exact_limit:
+                self.exact_hashes = None
+        index = (hashes >> np.uint64(64 - self.precision)).astype(np.int64)
+        remainder = hashes & np.uint64((1 << (64 - self.precision)) - 1)
+        rank = (64 - self.precision) - _bit_length(remainder) + 1
+        np.maximum.at(self.registers, index, rank)
+    
+    @property
+    def is_exact(self) -> bool:
+        """Whether count() is exact rather than a sketch estimate."""
+        return self.exact_hashes is not None
+    
+    def count(self) -> int:
+        if self.exact_hashes is not None:
+            return len(self.exact_hashes)
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.exp2(-self.registers.astype(np.float64)))
+        zeros = np.count_nonzero(self.registers == 0)
+        if estimate <= 2.5 * m and zeros > 0:
+            # Small-range correction (linear counting)
+            estimate = m * np.log(m / zeros)
+        return int(round(estimate))
+
+
+class _RunningMoments:
+    """Count, mean and sum of squared deviations, merged batch by batch."""
+    
+    def __init__(self):
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+    
+    def update(self, values: np.ndarray):
+        n_b = len(values)
+        if n_b == 0:
+            return
+        mean_b = float(values.mean())
+        m2_b = float(((values - mean_b) ** 2).sum())
+        n = self.n + n_b
+        delta = mean_b - self.mean
+        self.mean += delta * n_b / n
+        self.m2 += m2_b + delta * delta * self.n * n_b / n
+        self.n = n
+    
+    def std(self, ddof: int = 1) -> float:
+        return (self.m2 / (self.n - ddof)) ** 0.5 if self.n > ddof else float('nan')
+
+
+class _StreamingColumnProfile:
+    """Profile accumulators for one column, with memory independent of row count.
+    
+    arrow_type is the widened type the column is read as, inferred_type the
+    type Arrow inferred from the first block. The data_type reported is the
+    inferred type, as long as every later batch still converts to it.
+    """
+    
+    def __init__(self, arrow_type: pa.DataType, inferred_type: pa.DataType):
+        self.arrow_type = arrow_type
+        self.inferred_type = inferred_type
+        self.integral = True
+        self.total = 0
+        self.null_count = 0
+        self.distinct = _HyperLogLog()
+        self.moments = _RunningMoments()
+        self.min = None
+        self.max = None
+        self.min_length = None
+        self.max_length = None
+        self.sample_values = []
+    
+    def update(self, array: pa.Array):
+        self.total += len(array)
+        self.null_count += array.null_count
+        values = array.drop_null()
+        if len(values) == 0:
+            return
+        self.distinct.update(values.to_numpy(zero_copy_only=False))
+        
+        if _is_numeric_type(self.arrow_type):
+            numbers = values.to_numpy(zero_copy_only=False).astype(np.float64)
+            self.moments.update(numbers)
+            self.integral = self.integral and _is_integral(numbers)
+            self.min = numbers.min() if self.min is None else min(self.min, numbers.min())
+            self.max = numbers.max() if self.max is None else max(self.max, numbers.max())
+        elif _is_string_type(self.arrow_type):
+            if not (_is_string_type(self.inferred_type) or pa.types.is_null(self.inferred_type)):
+                # A date or bool column stays one while its values still parse as such
+                try:
+                    pc.cast(values, self.inferred_type)
+                except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+                    self.inferred_type = pa.string()
+            elif pa.types.is_null(self.inferred_type):
+                # Null in the first block, values later
+                self.inferred_type = pa.string()
+            lengths = pc.min_max(pc.utf8_length(values))
+            low, high = lengths["min"].as_py(), lengths["max"].as_py()
+            self.min_length = low if self.min_length is None else min(self.min_length, low)
+            self.max_length = high if self.max_length is None else max(self.max_length, high)
+            if len(self.sample_values) < 3:
+                self.sample_values += values.slice(0, 3 - len(self.sample_values)).to_pylist()
+    
+    def type_name(self) -> str:
+        """data_type of the column, in the vocabulary of _column_type_name."""
+        if _is_numeric_type(self.arrow_type):
+            return "integer" if self.moments.n > 0 and self.integral else "float"
+        return _arrow_type_name(self.inferred_type)
+    
+    def to_dict(self, column: str, is_cde: bool) -> dict:
+        non_null = self.total - self.null_count
+        # The sketch can overshoot slightly; never report more distinct values than rows
+        unique_count = min(self.distinct.count(), non_null)
+        col_profile = {
+            "column": column,
+            "is_cde": is_cde,
+            "data_type": self.type_name(),
+            "total_rows": self.total,
+            "non_null_count": non_null,
+            "null_count": self.null_count,
+            "completeness": round(non_null / self.total, 4) if self.total else 0,
+            "unique_count": unique_count,
+            "uniqueness": round(unique_count / non_null, 4) if non_null > 0 else 0,
+            "duplicate_count": non_null - unique_count,
+            # Past the sketch's exact limit both counts above are approximate
+            "unique_count_estimated": not self.distinct.is_exact,
+        }
+        if _is_numeric_type(self.arrow_type):
+            has_values = self.moments.n > 0
+            col_profile.update({
+                "min": float(self.min) if has_values else None,
+                "max": float(self.max) if has_values else None,
+                "mean": round(self.moments.mean, 2) if has_values else None,
+                "std": round(self.moments.std(), 2) if has_values else None,
+            })
+        elif _is_string_type(self.arrow_type):
+            col_profile.update({
+                "min_length": self.min_length,
+                "max_length": self.max_length,
+                "sample_values": [str(v) for v in self.sample_values],
+            })
+        return col_profile
+
+
+@functools.lru_cache(maxsize=4)
+def _cached_stream_profiles(abs_path: str, mtime_ns: int, size: int) -> dict:
+    schema = _csv_schema(abs_path)
+    inferred = _inferred_csv_schema(abs_path)
+    accumulators = {
+        name: _StreamingColumnProfile(schema.field(name).type, inferred.field(name).type)
+        for name in schema.names
+    }
+    for batch in iter_chunks(abs_path):
+        for name in schema.names:
+            accumulators[name].update(batch.column(name))
+    return {name: acc.to_dict(name, False) for name, acc in accumulators.items()}
+
+
+# Column profiling subtasks ask for their columns concurrently; the first one
+# streams the file and the rest wait for its cached result
+_stream_profiles_lock = threading.Lock()
+
+
+def _stream_column_profiles(file_path: str, cde_list: list, columns: list | None = None) -> list:
+    """Profile a CSV batch by batch.
+    
+    All columns are profiled in one pass per version of the file, and each
+    call slices out the columns it asks for. Distinct counts past the
+    sketch's exact limit are HyperLogLog estimates, flagged by
+    unique_count_estimated.
+    """
+    abs_path = os.path.abspath(file_path)
+    with _stream_profiles_lock:
+        profiles = _cached_stream_profiles(abs_path, *_stat(abs_path))
+    return [{**profiles[name], "is_cde": name in cde_list} for name in columns or profiles]
+
+
+def _stream_numeric_anomalies(file_path: str) -> tuple[list, list]:
+    """Scan a CSV twice for z-score and IQR outliers in each numeric column.
+    
+    The first pass merges running moments and keeps a uniform bottom-k sample
+    per column for the quartiles; the second pass counts outliers against
+    the resulting bounds. Past _ANOMALY_SAMPLE_SIZE values the quartiles,
+    and so the IQR outlier count, are estimates, flagged by iqr_estimated.
+    The sample is seeded, so a file gives the same estimates on every run.
+    
+    Returns:
+        The numeric column names, and anomaly entries for the columns with outliers
+    """
+    schema = _csv_schema(file_path)
+    numeric_cols = [f.name for f in schema if _is_numeric_type(f.type)]
+    rng = np.random.default_rng(0)
+    moments = {col: _RunningMoments() for col in numeric_cols}
+    samples = {col: (np.empty(0), np.empty(0)) for col in numeric_cols}
+    
+    for batch in iter_chunks(file_path, numeric_cols):
+        for col in numeric_cols:
+            values = batch.column(col).drop_null().to_numpy(zero_copy_only=False).astype(np.float64)
+            moments[col].update(values)
+            # Bottom-k sampling: keep the values with the k smallest random keys
+            sample, keys = samples[col]
+            sample = np.concatenate([sample, values])
+            keys = np.concatenate([keys, rng.random(len(values))])
+            if len(keys) > _ANOMALY_SAMPLE_SIZE:
+                keep = np.argpartition(keys, _ANOMALY_SAMPLE_SIZE)[:_ANOMALY_SAMPLE_SIZE]
+                sample, keys = sample[keep], keys[keep]
+            samples[col] = (sample, keys)
+    
+    quartiles = {
+        col: np.quantile(samples[col][0], [0.25, 0.75])
+        for col in numeric_cols
+        if moments[col].n >= 3
+    }
+    
+    outliers_z = dict.fromkeys(quartiles, 0)
+    outliers_iqr = dict.fromkeys(quartiles, 0)
+    for batch in iter_chunks(file_path, list(quartiles)):
+        for col, (q1, q3) in quartiles.items():
+            # Nulls become NaN, which never compares as an outlier - no drop_null() copy
+            values = batch.column(col).to_numpy(zero_copy_only=False).astype(np.float64, copy=False)
+            std = moments[col].std(ddof=0)
+            if std > 0:
+                outliers_z[col] += int(np.count_nonzero(np.abs(values - moments[col].mean) / std > 3))
+            iqr = q3 - q1
+            outliers_iqr[col] += int(np.count_nonzero((values < q1 - 1.5 * iqr) | (values > q3 + 1.5 * iqr)))
+    
+    anomalies = []
+    for col, (q1, q3) in quartiles.items():
+        if outliers_z[col] > 0 or outliers_iqr[col] > 0:
+            anomalies.append({
+                "column": col,
+                "outliers_zscore": outliers_z[col],
+                "outliers_iqr": outliers_iqr[col],
+                "iqr_estimated": moments[col].n > _ANOMALY_SAMPLE_SIZE,
+                "stats": {
+                    "mean": round(moments[col].mean, 2),
+                    "std": round(moments[col].std(), 2),
+                    "Q1": round(float(q1), 2),
+                    "Q3": round(float(q3), 2),
+                    "IQR": round(float(q3 - q1), 2)
+                }
+            })
+    return numeric_cols, anomalies
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize a tool result as indented JSON.
+    
+    orjson encodes NumPy scalars and arrays natively; anything else it cannot
+    encode, such as pandas Timestamps, falls back to str(). Non-string dict
+    keys, e.g. the integer column labels of a JSON array of arrays, are
+    written as strings, as json.dumps does.
+    """
+    return orjson.dumps(
+        obj,
+        default=str,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+    ).decode()
 
 
 class DataLoaderTool(BaseTool):
@@ -18,22 +776,32 @@ class DataLoaderTool(BaseTool):
     
     def _run(self, file_path: str) -> str:
         try:
-            if file_path.endswith('.csv'):
-                df = pd.read_csv(file_path)
-            elif file_path.endswith('.json'):
-                df = pd.read_json(file_path)
-            else:
+            if not file_path.endswith(('.csv', '.json')):
                 return f"Error: Unsupported file format. Use CSV or JSON."
             
+            if should_stream(file_path):
+                # Too large to materialize - read the schema and a few rows, and
+                # count rows by streaming a single column
+                column_names = _csv_schema(file_path).names
+                rows = sum(batch.num_rows for batch in iter_chunks(file_path, column_names[:1]))
+                sample = pd.read_csv(file_path, nrows=3)
+                memory_bytes = os.path.getsize(file_path)
+            else:
+                df = load_dataset(file_path)
+                column_names = list(df.columns)
+                rows = len(df)
+                sample = df.head(3)
+                memory_bytes = df.memory_usage(deep=True).sum()
+            
             info = {
                 "file": os.path.basename(file_path),
-                "rows": len(df),
-                "columns": len(df.columns),
-                "column_names": list(df.columns),
-                "sample_rows": df.head(3).to_dict(orient='records'),
-                "memory_usage_mb": round(df.memory_usage(deep=True).sum() / 1024 / 1024, 2)
+                "rows": rows,
+                "columns": len(column_names),
+                "column_names": column_names,
+                "sample_rows": sample.to_dict(orient='records'),
+                "memory_usage_mb": round(memory_bytes / 1024 / 1024, 2)
             }
-            return json.dumps(info, indent=2, default=str)
+            return _dumps(info)
         except Exception as e:
             return f"Error loading file: {str(e)}"
 
@@ -46,8 +814,7 @@ class CDELoaderTool(BaseTool):
     
     def _run(self, config_path: str) -> str:
         try:
-            with open(config_path, 'r') as f:
-                config = json.load(f)
+            config = load_cde_config(config_path)
             
             cde_summary = {
                 "dataset": config.get("dataset"),
@@ -57,65 +824,106 @@ class CDELoaderTool(BaseTool):
                 "thresholds": config.get("quality_thresholds", {}),
                 "cde_details": config.get("critical_data_elements", [])
             }
-            return json.dumps(cde_summary, indent=2)
+            return _dumps(cde_summary)
         except Exception as e:
             return f"Error loading CDE config: {str(e)}"
 
 
+def _str_len_stats(values: pd.Series) -> tuple[int | None, int | None]:
+    """Min and max character length of a column's non-null values, as strings.
+    
+    Lengths come from Arrow's UTF-8 kernel rather than a per-value str.len().
+    Both are None when the column has no values.
+    """
+    strings = pa.array(values.dropna().astype(str), type=pa.string())
+    lengths = pc.min_max(pc.utf8_length(strings))
+    return lengths["min"].as_py(), lengths["max"].as_py()
+
+
 class ProfilerTool(BaseTool):
     """Profile dataset columns for data quality metrics."""
     
     name: str = "data_profiler"
-    description: str = "Profile a dataset to calculate completeness, uniqueness, data types, and statistics for each column. Provide file_path and optionally cde_fields as comma-separated list."
+    description: str = "Profile a dataset to calculate completeness, uniqueness, data types, and statistics for each column. Provide file_path, optionally cde_fields as comma-separated list, and optionally columns as comma-separated list to profile only those columns."
     
-    def _run(self, file_path: str, cde_fields: str = "") -> str:
+    def _run(self, file_path: str, cde_fields: str = "", columns: str = "") -> str:
         try:
-            df = pd.read_csv(file_path) if file_path.endswith('.csv') else pd.read_json(file_path)
             cde_list = [f.strip() for f in cde_fields.split(',')] if cde_fields else []
+            column_list = [c.strip() for c in columns.split(',')] if columns else []
             
-            profile = []
-            for col in df.columns:
-                col_data = df[col]
-                is_cde = col in cde_list
+            if should_stream(file_path):
+                # Too large to materialize - profile batch by batch
+                profile = _stream_column_profiles(file_path, cde_list, column_list)
+            else:
+                df = load_dataset(file_path)
+                if column_list:
+                    # Requested by name, so match integer labels (JSON arrays of arrays) as strings
+                    labels = {str(c): c for c in df.columns}
+                    df = df[[labels[c] for c in column_list]]
                 
-                # Basic stats
-                total = len(col_data)
-                non_null = col_data.notna().sum()
-                null_count = col_data.isna().sum()
-                unique_count = col_data.nunique()
+                # Whole-frame reductions: one call per statistic instead of one per column
+                total = len(df)
+                null_counts = df.isna().sum()
+                unique_counts = df.nunique()
+                numeric_df = df[[c for c in df.columns if pd.api.types.is_numeric_dtype(df[c])]]
+                mins = numeric_df.min()
+                maxs = numeric_df.max()
+                # optimize_dtypes can narrow floats to float32; reduce those in float64
+                # so the mean and std keep their precision
+                wide_df = numeric_df.astype({c: np.float64 for c, t in numeric_df.dtypes.items() if t == np.float32})
+                means = wide_df.mean()
+                stds = wide_df.std()
+                string_cols = [
+                    c for c in df.columns
+                    if pd.api.types.is_string_dtype(df[c])
+                    or pd.api.types.is_object_dtype(df[c])
+                    or isinstance(df[c].dtype, pd.CategoricalDtype)
+                ]
+                length_stats = {c: _str_len_stats(df[c]) for c in string_cols}
                 
-                col_profile = {
-                    "column": col,
-                    "is_cde": is_cde,
-                    "data_type": str(col_data.dtype),
-                    "total_rows": total,
-                    "non_null_count": int(non_null),
-                    "null_count": int(null_count),
-                    "completeness": round(non_null / total, 4),
-                    "unique_count": int(unique_count),
-                    "uniqueness": round(unique_count / non_null, 4) if non_null > 0 else 0,
-                    "duplicate_count": int(non_null - unique_count),
-                }
+                profile = []
+                for col in df.columns:
+                    col_data = df[col]
+                    is_cde = str(col) in cde_list
+                
+                    # Basic stats
+                    null_count = null_counts[col]
+                    non_null = total - null_count
+                    all_null = null_count == total
+                    unique_count = unique_counts[col]
+                
+                    col_profile = {
+                        "column": col,
+                        "is_cde": is_cde,
+                        "data_type": _column_type_name(col_data),
+                        "total_rows": total,
+                        "non_null_count": non_null,
+                        "null_count": null_count,
+                        "completeness": round(non_null / total, 4),
+                        "unique_count": unique_count,
+                        "uniqueness": round(unique_count / non_null, 4) if non_null > 0 else 0,
+                        "duplicate_count": non_null - unique_count,
+                    }
                 
-                # Numeric stats
-                if pd.api.types.is_numeric_dtype(col_data):
-                    col_profile.update({
-                        "min": float(col_data.min()) if not col_data.isna().all() else None,
-                        "max": float(col_data.max()) if not col_data.isna().all() else None,
-                        "mean": round(float(col_data.mean()), 2) if not col_data.isna().all() else None,
-                        "std": round(float(col_data.std()), 2) if not col_data.isna().all() else None,
-                    })
+                    # Numeric stats
+                    if pd.api.types.is_numeric_dtype(col_data):
+                        col_profile.update({
+                            "min": mins[col] if not all_null else None,
+                            "max": maxs[col] if not all_null else None,
+                            "mean": round(means[col], 2) if not all_null else None,
+                            "std": round(stds[col], 2) if not all_null else None,
+                        })
                 
-                # String stats
-                if col_data.dtype == 'object':
-                    lengths = col_data.dropna().astype(str).str.len()
-                    col_profile.update({
-                        "min_length": int(lengths.min()) if len(lengths) > 0 else None,
-                        "max_length": int(lengths.max()) if len(lengths) > 0 else None,
-                        "sample_values": list(col_data.dropna().head(3).astype(str)),
-                    })
+                    # String stats
+                    if col in length_stats:
+                        min_length, max_length = length_stats[col]
+                        col_profile.update({
+                            "min_length": min_length,
+                            "max_length": max_length,
+                            "sample_values": list(col_data.dropna().head(3).astype(str)),
+                        })
                 
-                profile.append(col_profile)
+                    profile.append(col_profile)
             
             # Summary
             cde_profiles = [p for p in profile if p["is_cde"]]
@@ -131,11 +939,28 @@ class ProfilerTool(BaseTool):
                 "column_profiles": profile
             }
             
-            return json.dumps(summary, indent=2)
+            return _dumps(summary)
         except Exception as e:
             return f"Error profiling data: {str(e)}"
 
 
+def _mk_issue(field: str, rule: str, severity: str, invalid_count: int, message: str, sample_invalid=()) -> dict:
+    """Build a validation issue; every issue has the same keys in the same order."""
+    return {
+        "field": field,
+        "rule": rule,
+        "severity": severity,
+        "invalid_count": invalid_count,
+        "sample_invalid": list(sample_invalid),
+        "message": message,
+    }
+
+
+def _count_and_samples(values: pd.Series, mask: np.ndarray, k: int = 3) -> tuple[int, list]:
+    """Count the values selected by a boolean mask and return the first k of them."""
+    return np.count_nonzero(mask), list(values.iloc[np.flatnonzero(mask)[:k]])
+
+
 class ValidatorTool(BaseTool):
     """Validate data against business rules."""
     
@@ -144,124 +969,104 @@ class ValidatorTool(BaseTool):
     
     def _run(self, file_path: str, cde_config_path: str = "") -> str:
         try:
-            df = pd.read_csv(file_path) if file_path.endswith('.csv') else pd.read_json(file_path)
+            df = load_dataset(file_path)
+            cols = set(df.columns)
             
             # Load CDE config if provided
-            cde_rules = {}
+            not_null_fields, unique_fields = (), ()
             if cde_config_path and os.path.exists(cde_config_path):
-                with open(cde_config_path, 'r') as f:
-                    config = json.load(f)
-                    for cde in config.get("critical_data_elements", []):
-                        cde_rules[cde["field"]] = cde
+                _, not_null_fields, unique_fields = load_cde_rules(cde_config_path)
             
             issues = []
             
-            # Email validation
-            if 'email' in df.columns:
-                email_pattern = r'^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$'
-                invalid_emails = df[df['email'].notna() & ~df['email'].astype(str).str.match(email_pattern)]
-                if len(invalid_emails) > 0:
-                    issues.append({
-                        "field": "email",
-                        "rule": "format_validation",
-                        "severity": "HIGH",
-                        "invalid_count": len(invalid_emails),
-                        "sample_invalid": list(invalid_emails['email'].head(3)),
-                        "message": f"{len(invalid_emails)} records have invalid email format"
-                    })
-            
-            # Phone validation
-            if 'phone' in df.columns:
-                phone_pattern = r'^\d{3}-\d{3}-\d{4}$'
-                invalid_phones = df[df['phone'].notna() & ~df['phone'].astype(str).str.match(phone_pattern)]
-                if len(invalid_phones) > 0:
-                    issues.append({
-                        "field": "phone",
-                        "rule": "format_validation",
-                        "severity": "MEDIUM",
-                        "invalid_count": len(invalid_phones),
-                        "sample_invalid": list(invalid_phones['phone'].head(3)),
-                        "message": f"{len(invalid_phones)} records have invalid phone format"
-                    })
+            # Format validation (email, phone)
+            for field, (pattern, severity) in FORMAT_RULES.items():
+                if field in cols:
+                    values = df[field].dropna().astype(str)
+                    invalid_count, samples = _count_and_samples(values, ~_format_match_mask(field, values))
+                    if invalid_count > 0:
+                        issues.append(_mk_issue(
+                            field,
+                            "format_validation",
+                            severity,
+                            invalid_count,
+                            f"{invalid_count} records have invalid {field} format",
+                            samples,
+                        ))
             
             # Date validation (no future dates for DOB)
-            if 'date_of_birth' in df.columns:
-                today = datetime.now().date()
-                df['dob_parsed'] = pd.to_datetime(df['date_of_birth'], errors='coerce')
-                future_dob = df[df['dob_parsed'].dt.date > today]
-                if len(future_dob) > 0:
-                    issues.append({
-                        "field": "date_of_birth",
-                        "rule": "future_date",
-                        "severity": "CRITICAL",
-                        "invalid_count": len(future_dob),
-                        "sample_invalid": list(future_dob['date_of_birth'].head(3).astype(str)),
-                        "message": f"{len(future_dob)} records have future date of birth"
-                    })
+            if 'date_of_birth' in cols:
+                # Compared as datetime64[D] arrays - no boxing into date objects; NaT never compares greater
+                today = np.datetime64(datetime.now().date(), 'D')
+                dob_parsed = pd.to_datetime(df['date_of_birth'], errors='coerce', cache=True)
+                future = dob_parsed.to_numpy(dtype='datetime64[D]') > today
+                invalid_count, samples = _count_and_samples(df['date_of_birth'], future)
+                if invalid_count > 0:
+                    issues.append(_mk_issue(
+                        "date_of_birth",
+                        "future_date",
+                        "CRITICAL",
+                        invalid_count,
+                        f"{invalid_count} records have future date of birth",
+                        samples,
+                    ))
             
-            # Negative balance check
-            if 'account_balance' in df.columns:
-                negative_balance = df[df['account_balance'] < 0]
-                if len(negative_balance) > 0:
-                    issues.append({
-                        "field": "account_balance",
-                        "rule": "negative_value",
-                        "severity": "HIGH",
-                        "invalid_count": len(negative_balance),
-                        "sample_invalid": list(negative_balance['account_balance'].head(3)),
-                        "message": f"{len(negative_balance)} records have negative account balance"
-                    })
+            # Numeric range checks - each compound comparison is fused into one NumExpr pass
+            for field, (expression, rule, severity, description) in RANGE_RULES.items():
+                if field in cols:
+                    invalid_count, samples = _count_and_samples(df[field], df.eval(expression).to_numpy(dtype=bool))
+                    if invalid_count > 0:
+                        issues.append(_mk_issue(
+                            field,
+                            rule,
+                            severity,
+                            invalid_count,
+                            f"{invalid_count} records have {description}",
+                            samples,
+                        ))
             
-            # Credit score range check
-            if 'credit_score' in df.columns:
-                invalid_scores = df[(df['credit_score'] < 300) | (df['credit_score'] > 850)]
-                if len(invalid_scores) > 0:
-                    issues.append({
-                        "field": "credit_score",
-                        "rule": "range_validation",
-                        "severity": "HIGH",
-                        "invalid_count": len(invalid_scores),
-                        "sample_invalid": list(invalid_scores['credit_score'].head(3)),
-                        "message": f"{len(invalid_scores)} records have credit score outside valid range (300-850)"
-                    })
+            # CDE null and duplicate checks - one reduction over all the CDE columns
+            not_null_cols = [f for f in not_null_fields if f in cols]
+            unique_cols = [f for f in unique_fields if f in cols]
+            null_counts = df[not_null_cols].isna().sum()
+            unique_df = df[unique_cols]
+            # Non-null values minus distinct values = values repeating an earlier one
+            dup_counts = unique_df.count() - unique_df.nunique(dropna=True)
             
-            # CDE null checks
-            for field, rules in cde_rules.items():
-                if field in df.columns and rules.get("nullable") == False:
-                    null_count = df[field].isna().sum()
-                    if null_count > 0:
-                        issues.append({
-                            "field": field,
-                            "rule": "cde_not_nullable",
-                            "severity": "CRITICAL",
-                            "invalid_count": int(null_count),
-                            "message": f"CDE field '{field}' has {null_count} null values but is marked as non-nullable"
-                        })
+            for field, null_count in null_counts.items():
+                if null_count > 0:
+                    issues.append(_mk_issue(
+                        field,
+                        "cde_not_nullable",
+                        "CRITICAL",
+                        null_count,
+                        f"CDE field '{field}' has {null_count} null values but is marked as non-nullable",
+                    ))
             
             # Duplicate check for unique fields
-            for field, rules in cde_rules.items():
-                if field in df.columns and rules.get("unique") == True:
-                    dup_count = df[field].dropna().duplicated().sum()
-                    if dup_count > 0:
-                        issues.append({
-                            "field": field,
-                            "rule": "cde_uniqueness",
-                            "severity": "CRITICAL",
-                            "invalid_count": int(dup_count),
-                            "message": f"CDE field '{field}' has {dup_count} duplicate values but is marked as unique"
-                        })
+            for field, dup_count in dup_counts.items():
+                if dup_count > 0:
+                    issues.append(_mk_issue(
+                        field,
+                        "cde_uniqueness",
+                        "CRITICAL",
+                        dup_count,
+                        f"CDE field '{field}' has {dup_count} duplicate values but is marked as unique",
+                    ))
             
+            severity_counts = Counter(i["severity"] for i in issues)
+            total_invalid = sum(i["invalid_count"] for i in issues)
             result = {
                 "total_records": len(df),
                 "total_issues": len(issues),
-                "critical_issues": len([i for i in issues if i["severity"] == "CRITICAL"]),
-                "high_issues": len([i for i in issues if i["severity"] == "HIGH"]),
-                "medium_issues": len([i for i in issues if i["severity"] == "MEDIUM"]),
-                "validity_score": round(1 - (sum(i["invalid_count"] for i in issues) / (len(df) * len(df.columns))), 4),
+                "critical_issues": severity_counts["CRITICAL"],
+                "high_issues": severity_counts["HIGH"],
+                "medium_issues": severity_counts["MEDIUM"],
+                "validity_score": round(1 - (total_invalid / (len(df) * len(df.columns))), 4),
                 "issues": issues
             }
             
-            return json.dumps(result, indent=2, default=str)
+            return _dumps(result)
         except Exception as e:
             return f"Error validating data: {str(e)}"
 
@@ -274,39 +1079,44 @@ class AnomalyDetectorTool(BaseTool):
     
     def _run(self, file_path: str) -> str:
         try:
-            df = pd.read_csv(file_path) if file_path.endswith('.csv') else pd.read_json(file_path)
+            if should_stream(file_path):
+                # Too large to materialize - two streamed passes instead
+                numeric_cols, anomalies = _stream_numeric_anomalies(file_path)
+            else:
+                df = load_dataset(file_path)
             
-            anomalies = []
-            numeric_cols = df.select_dtypes(include=['number']).columns
+                anomalies = []
+                numeric_cols = df.select_dtypes(include=['number']).columns
+                values = df[numeric_cols].to_numpy(dtype=np.float64, na_value=np.nan)
             
-            for col in numeric_cols:
-                col_data = df[col].dropna()
-                if len(col_data) < 3:
-                    continue
-                
-                # Z-score method
-                z_scores = stats.zscore(col_data)
-                outliers_z = (abs(z_scores) > 3).sum()
+                # Z-score and IQR outlier counts for all columns in one compiled pass each
+                outliers_z = zscore_outliers(values, 3.0)
+                outliers_iqr = iqr_outliers(values, 1.5)
                 
-                # IQR method
-                Q1 = col_data.quantile(0.25)
-                Q3 = col_data.quantile(0.75)
-                IQR = Q3 - Q1
-                outliers_iqr = ((col_data < (Q1 - 1.5 * IQR)) | (col_data > (Q3 + 1.5 * IQR))).sum()
+                # Stats for the flagged columns in one NaN-aware NumPy call each
+                counts = np.count_nonzero(~np.isnan(values), axis=0)
+                flagged = np.flatnonzero((counts >= 3) & ((outliers_z > 0) | (outliers_iqr > 0)))
+                # Nothing flagged leaves an empty block, whose quantiles cannot be unpacked
+                if flagged.size:
+                    block = values[:, flagged]
+                    means = np.nanmean(block, axis=0)
+                    stds = np.nanstd(block, axis=0, ddof=1)
+                    q1s, q3s = np.nanquantile(block, [0.25, 0.75], axis=0)
                 
-                if outliers_z > 0 or outliers_iqr > 0:
-                    anomalies.append({
-                        "column": col,
-                        "outliers_zscore": int(outliers_z),
-                        "outliers_iqr": int(outliers_iqr),
-                        "stats": {
-                            "mean": round(float(col_data.mean()), 2),
-                            "std": round(float(col_data.std()), 2),
-                            "Q1": round(float(Q1), 2),
-                            "Q3": round(float(Q3), 2),
-                            "IQR": round(float(IQR), 2)
-                        }
-                    })
+                    for k, j in enumerate(flagged):
+                        anomalies.append({
+                            "column": numeric_cols[j],
+                            "outliers_zscore": outliers_z[j],
+                            "outliers_iqr": outliers_iqr[j],
+                            "iqr_estimated": False,
+                            "stats": {
+                                "mean": round(means[k], 2),
+                                "std": round(stds[k], 2),
+                                "Q1": round(q1s[k], 2),
+                                "Q3": round(q3s[k], 2),
+                                "IQR": round(q3s[k] - q1s[k], 2)
+                            }
+                        })
             
             result = {
                 "numeric_columns_analyzed": len(numeric_cols),
@@ -314,6 +1124,28 @@ class AnomalyDetectorTool(BaseTool):
                 "anomalies": anomalies
             }
             
-            return json.dumps(result, indent=2)
+            return _dumps(result)
         except Exception as e:
             return f"Error detecting anomalies: {str(e)}"
+
+
+def run_quality_suite(file_path: str, cde_config_path: str = "") -> dict:
+    """Run the profiler, validator and anomaly detector on a dataset concurrently.
+    
+    The tools' pandas/NumPy reductions release the GIL, so a thread pool runs
+    them in parallel over the one shared frame. The frame is loaded up front,
+    as concurrent cache misses would each parse the file.
+    
+    Returns:
+        The JSON output of each tool, keyed "profile", "validation" and "anomalies"
+    """
+    if not should_stream(file_path):
+        load_dataset(file_path)
+    
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = {
+            "profile": executor.submit(ProfilerTool()._run, file_path),
+            "validation": executor.submit(ValidatorTool()._run, file_path, cde_config_path),
+            "anomalies": executor.submit(AnomalyDetectorTool()._run, file_path),
+        }
+        return {name: future.result() for name, future in futures.items()}
@@ -0,0 +1,7 @@
+import os
+import tempfile
+
+# Keep the tools' Parquet cache and .env out of the test run; settings reads
+# both at import time
+os.environ.setdefault("DQ_CACHE_DIR", tempfile.mkdtemp(prefix="dq-cache-"))
+os.environ.setdefault("DQ_SKIP_DOTENV", "1")
@@ -0,0 +1,214 @@
+import json
+
+import numpy as np
+import pandas as pd
+
+from src.tools import data_tools
+from src.tools.data_tools import AnomalyDetectorTool, DataLoaderTool, ProfilerTool, ValidatorTool
+
+
+def _write_csv(path, df):
+    df.to_csv(path, index=False)
+    return str(path)
+
+
+def test_anomalies_clean_numeric_column(tmp_path):
+    path = _write_csv(tmp_path / "clean.csv", pd.DataFrame({"value": np.arange(100)}))
+
+    result = json.loads(AnomalyDetectorTool()._run(path))
+
+    assert result == {"numeric_columns_analyzed": 1, "columns_with_anomalies": 0, "anomalies": []}
+
+
+def test_anomalies_header_only_csv(tmp_path):
+    path = tmp_path / "empty.csv"
+    path.write_text("a,b\n")
+
+    result = json.loads(AnomalyDetectorTool()._run(str(path)))
+
+    assert result["columns_with_anomalies"] == 0
+    assert result["anomalies"] == []
+
+
+def test_anomalies_flags_outlier(tmp_path):
+    values = np.r_[np.linspace(0, 1, 200), 100.0]
+    path = _write_csv(tmp_path / "outlier.csv", pd.DataFrame({"value": values}))
+
+    result = json.loads(AnomalyDetectorTool()._run(path))
+
+    assert result["columns_with_anomalies"] == 1
+    anomaly = result["anomalies"][0]
+    assert anomaly["column"] == "value"
+    assert anomaly["outliers_zscore"] == 1
+    assert anomaly["outliers_iqr"] == 1
+    assert anomaly["stats"]["Q1"] == round(float(np.quantile(values, 0.25)), 2)
+
+
+def test_loader_keeps_unhashable_json_columns(tmp_path):
+    path = tmp_path / "nested.json"
+    path.write_text(json.dumps([{"id": i, "tags": ["a", "b"], "meta": {"k": i}} for i in range(4)]))
+
+    info = json.loads(DataLoaderTool()._run(str(path)))
+
+    assert info["rows"] == 4
+    assert info["column_names"] == ["id", "tags", "meta"]
+
+
+def test_tools_handle_integer_column_labels(tmp_path):
+    path = tmp_path / "rows.json"
+    path.write_text("[[1, 2], [3, 4]]")
+    path = str(path)
+
+    info = json.loads(DataLoaderTool()._run(path))
+    profile = json.loads(ProfilerTool()._run(path, cde_fields="1", columns="1"))
+
+    assert info["column_names"] == [0, 1]
+    assert info["sample_rows"][0] == {"0": 1, "1": 2}
+    assert profile["column_profiles"][0]["max"] == 4
+    assert profile["cde_columns"] == 1
+
+
+def test_tools_rename_duplicate_headers_like_pandas(tmp_path, monkeypatch):
+    path = tmp_path / "dup.csv"
+    path.write_text("id,id,email\n1,2,x@y.com\n3,4,bad\n")
+    path = str(path)
+    expected = list(pd.read_csv(path).columns)
+
+    info = json.loads(DataLoaderTool()._run(path))
+    profile = json.loads(ProfilerTool()._run(path))
+    issues = json.loads(ValidatorTool()._run(path))
+    anomalies = json.loads(AnomalyDetectorTool()._run(path))
+
+    assert info["column_names"] == expected == ["id", "id.1", "email"]
+    assert [p["column"] for p in profile["column_profiles"]] == expected
+    assert issues["issues"][0]["sample_invalid"] == ["bad"]
+    assert anomalies["numeric_columns_analyzed"] == 2
+
+    monkeypatch.setattr(data_tools, "STREAMING_THRESHOLD_MB", 0)
+    streamed = json.loads(ProfilerTool()._run(path))
+    assert [p["column"] for p in streamed["column_profiles"]] == expected
+    assert [p["max"] for p in streamed["column_profiles"][:2]] == [3, 4]
+
+
+def test_profile_stats_keep_precision_of_narrowed_floats(tmp_path):
+    values = 500_000 + np.arange(20_000) * 0.25
+    path = _write_csv(tmp_path / "quarters.csv", pd.DataFrame({"amount": values}))
+
+    column = json.loads(ProfilerTool()._run(path))["column_profiles"][0]
+
+    assert data_tools.load_dataset(path)["amount"].dtype == np.float32
+    assert column["mean"] == round(values.mean(), 2)
+    assert column["std"] == round(values.std(ddof=1), 2)
+
+
+def test_parquet_cache_is_off_unless_configured_and_capped(tmp_path, monkeypatch):
+    path = _write_csv(tmp_path / "small.csv", pd.DataFrame({"id": np.arange(1000)}))
+    cache_dir = tmp_path / "cache"
+
+    monkeypatch.setattr(data_tools, "CACHE_DIR", "")
+    data_tools._read_dataset(path)
+    assert not cache_dir.exists()
+
+    monkeypatch.setattr(data_tools, "CACHE_DIR", str(cache_dir))
+    monkeypatch.setattr(data_tools, "CACHE_MAX_MB", 0)
+    df = data_tools._read_dataset(path)
+    assert len(df) == 1000
+    assert list(cache_dir.iterdir()) == []
+
+
+def test_streaming_widens_types_inferred_from_first_block(tmp_path, monkeypatch):
+    monkeypatch.setattr(data_tools, "STREAMING_THRESHOLD_MB", 0)
+    monkeypatch.setattr(data_tools, "_STREAM_BLOCK_SIZE", 1 << 10)
+    # Integers and empty notes fill the first blocks; a float and a note come last
+    n = 2000
+    path = tmp_path / "late_types.csv"
+    path.write_text("amount,note\n" + "".join(f"{i},\n" for i in range(n - 1)) + "1.5,late\n")
+    path = str(path)
+
+    profile = json.loads(ProfilerTool()._run(path))
+    anomalies = json.loads(AnomalyDetectorTool()._run(path))
+
+    by_column = {p["column"]: p for p in profile["column_profiles"]}
+    assert by_column["amount"]["max"] == n - 2
+    assert by_column["note"]["non_null_count"] == 1
+    assert anomalies["numeric_columns_analyzed"] == 1
+
+
+def test_streamed_profiles_read_file_once_per_version(tmp_path, monkeypatch):
+    monkeypatch.setattr(data_tools, "STREAMING_THRESHOLD_MB", 0)
+    passes = []
+    iter_chunks = data_tools.iter_chunks
+    monkeypatch.setattr(data_tools, "iter_chunks", lambda *a, **kw: passes.append(a) or iter_chunks(*a, **kw))
+    path = tmp_path / "wide.csv"
+    path.write_text("a,b,c\n1,x,2.5\n2,y,3.5\n")
+    path = str(path)
+
+    profiles = [json.loads(ProfilerTool()._run(path, cde_fields="b", columns=col)) for col in "abc"]
+
+    assert len(passes) == 1
+    assert [p["column_profiles"][0]["column"] for p in profiles] == ["a", "b", "c"]
+    assert [p["column_profiles"][0]["is_cde"] for p in profiles] == [False, True, False]
+
+
+def test_streamed_and_loaded_profiles_report_same_types(tmp_path, monkeypatch):
+    monkeypatch.setattr(data_tools, "_STREAM_BLOCK_SIZE", 1 << 10)
+    # "late" reads as a date in the first block only
+    rows = "".join(f"{i},{i}.5,true,2020-01-01,2020-01-01 10:00:00,,x,{i if i % 2 else ''},2020-01-01\n" for i in range(200))
+    path = tmp_path / "types.csv"
+    path.write_text("i,f,b,d,t,n,s,inull,late\n" + rows + "1,1.5,false,2020-01-02,2020-01-02 10:00:00,,y,1,soon\n")
+    path = str(path)
+
+    loaded = json.loads(ProfilerTool()._run(path))
+    monkeypatch.setattr(data_tools, "STREAMING_THRESHOLD_MB", 0)
+    streamed = json.loads(ProfilerTool()._run(path))
+
+    types = {p["column"]: p["data_type"] for p in streamed["column_profiles"]}
+    assert types == {p["column"]: p["data_type"] for p in loaded["column_profiles"]}
+    assert types == {
+        "i": "integer", "f": "float", "b": "boolean", "d": "date", "t": "datetime",
+        "n": "null", "s": "string", "inull": "integer", "late": "string",
+    }
+
+
+def test_streamed_anomalies_repeat_and_flag_estimates(tmp_path, monkeypatch):
+    monkeypatch.setattr(data_tools, "STREAMING_THRESHOLD_MB", 0)
+    monkeypatch.setattr(data_tools, "_STREAM_BLOCK_SIZE", 1 << 12)
+    monkeypatch.setattr(data_tools, "_ANOMALY_SAMPLE_SIZE", 100)
+    values = np.r_[np.random.default_rng(1).normal(size=5000), 50.0]
+    path = _write_csv(tmp_path / "sampled.csv", pd.DataFrame({"value": values}))
+
+    first = AnomalyDetectorTool()._run(path)
+    second = AnomalyDetectorTool()._run(path)
+
+    assert first == second
+    assert json.loads(first)["anomalies"][0]["iqr_estimated"] is True
+
+
+def test_hyperloglog_flags_estimates():
+    sketch = data_tools._HyperLogLog(exact_limit=100)
+    sketch.update(np.arange(50))
+    assert sketch.is_exact and sketch.count() == 50
+
+    sketch.update(np.arange(50, 10_000))
+    assert not sketch.is_exact
+    assert abs(sketch.count() - 10_000) < 300
+
+
+def test_format_match_mask_matches_whole_values():
+    values = pd.Series(["a@b.com", "bad", "x@y.co.uk", " a@b.com", "a@b.com trailing"], dtype=str)
+
+    mask = data_tools._format_match_mask("email", values)
+
+    assert mask.tolist() == [True, False, True, False, False]
+    assert data_tools._format_match_mask("phone", pd.Series(["555-123-4567", "5551234567"], dtype=str)).tolist() == [True, False]
+
+
+def test_loader_returns_same_dtypes_with_and_without_parquet_cache(tmp_path):
+    # Few distinct dates: categorized by the loader, which Parquet reads back as object
+    path = tmp_path / "dates.csv"
+    path.write_text("id,joined\n" + "".join(f"{i},2020-01-0{1 + i % 2}\n" for i in range(10)))
+
+    first = data_tools._read_dataset(str(path))
+    second = data_tools._read_dataset(str(path))
+
+    assert first.dtypes.astype(str).tolist() == second.dtypes.astype(str).tolist()